@@ -9,10 +9,79 @@ from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
 
-def create_sample_presentation(output_path: str = None):
-    """Create a sample PowerPoint presentation with named shapes and tables."""
+# Colors and font sizes shared across the deck, created once at import
+NAVY = RGBColor(0x00, 0x33, 0x66)
+OCEAN = RGBColor(0x00, 0x66, 0x99)
+WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+GRAY = RGBColor(0x66, 0x66, 0x66)
+GREEN = RGBColor(0x00, 0x99, 0x33)
+DARK = RGBColor(0x33, 0x33, 0x33)
+BLACK = RGBColor(0x00, 0x00, 0x00)
+
+PT12 = Pt(12)
+PT14 = Pt(14)
+PT16 = Pt(16)
+PT18 = Pt(18)
+PT24 = Pt(24)
+PT28 = Pt(28)
+PT44 = Pt(44)
+
+
+def _set_text(shape, paragraphs):
+    """
+    Fill a shape's text frame with one Arial run per paragraph.
+
+    Each paragraph is a (text, size, bold, color, alignment) tuple; the first
+    reuses the frame's existing paragraph, the rest are appended.
+    """
+    tf = shape.text_frame
+    for i, (text, size, bold, color, alignment) in enumerate(paragraphs):
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        if alignment is not None:
+            p.alignment = alignment
+        run = p.add_run()
+        run.text = text
+        font = run.font
+        font.size = size
+        if bold:
+            font.bold = True
+        font.name = "Arial"
+        font.color.rgb = color
+
+
+@contextmanager
+def _stored_zip_writes():
+    """Temporarily make python-pptx write package parts without deflate compression."""
+    try:
+        from pptx.opc.serialized import _ZipPkgWriter
+    except ImportError:
+        # Older python-pptx layout; just save compressed
+        yield
+        return
+
+    original_write = _ZipPkgWriter.write
+
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+
+    _ZipPkgWriter.write = write
+    try:
+        yield
+    finally:
+        _ZipPkgWriter.write = original_write
+
+
+def create_sample_presentation(output_path: str = None, compress: bool = True):
+    """
+    Create a sample PowerPoint presentation with named shapes and tables.
+
+    Pass compress=False to skip zlib when saving, which is faster for
+    throwaway decks at the cost of a larger file.
+    """
     if output_path is None:
         # Default to same directory as this script
         script_dir = Path(__file__).parent
@@ -31,27 +100,12 @@ def create_sample_presentation(output_path: str = None):
     # Title shape
     title = slide1.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(12.333), Inches(1))
     title.name = "Title"
-    tf = title.text_frame
-    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Investor Report"
-    run.font.size = Pt(44)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x33, 0x66)
+    _set_text(title, [("Investor Report", PT44, True, NAVY, PP_ALIGN.CENTER)])
 
     # Date shape
     date_box = slide1.shapes.add_textbox(Inches(0.5), Inches(3.8), Inches(12.333), Inches(0.5))
     date_box.name = "ReportDate"
-    tf = date_box.text_frame
-    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Q4 2024"
-    run.font.size = Pt(24)
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+    _set_text(date_box, [("Q4 2024", PT24, False, GRAY, PP_ALIGN.CENTER)])
 
     # =========================================================================
     # Slide 2: Key Metrics
@@ -61,117 +115,51 @@ def create_sample_presentation(output_path: str = None):
     # Section title
     section_title = slide2.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.333), Inches(0.6))
     section_title.name = "SectionTitle"
-    tf = section_title.text_frame
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Key Performance Metrics"
-    run.font.size = Pt(28)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x33, 0x66)
+    _set_text(section_title, [("Key Performance Metrics", PT28, True, NAVY, None)])
 
     # Revenue shape
     revenue_box = slide2.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), Inches(1.2), Inches(3), Inches(1.5))
     revenue_box.name = "RevenueBox"
     revenue_box.fill.solid()
-    revenue_box.fill.fore_color.rgb = RGBColor(0x00, 0x66, 0x99)
-    tf = revenue_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Revenue"
-    run.font.size = Pt(14)
-    run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
-    run.font.name = "Arial"
-    p = tf.add_paragraph()
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = "$5,000,000"
-    run.font.size = Pt(28)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
-    run.font.name = "Arial"
+    revenue_box.fill.fore_color.rgb = OCEAN
+    revenue_box.text_frame.word_wrap = True
+    _set_text(revenue_box, [
+        ("Revenue", PT14, False, WHITE, None),
+        ("$5,000,000", PT28, True, WHITE, PP_ALIGN.CENTER),
+    ])
 
     # Create separate shape for revenue value that can be updated
     revenue_value = slide2.shapes.add_textbox(Inches(0.5), Inches(2.0), Inches(3), Inches(0.6))
     revenue_value.name = "RevenueValue"
-    tf = revenue_value.text_frame
-    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "$5,000,000"
-    run.font.size = Pt(24)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x66, 0x99)
+    _set_text(revenue_value, [("$5,000,000", PT24, True, OCEAN, PP_ALIGN.CENTER)])
 
     # Growth Rate shape
     growth_box = slide2.shapes.add_textbox(Inches(4), Inches(1.2), Inches(3), Inches(1.5))
     growth_box.name = "GrowthRate"
-    tf = growth_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = "Growth Rate"
-    run.font.size = Pt(14)
-    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
-    run.font.name = "Arial"
-    p = tf.add_paragraph()
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = "25.5%"
-    run.font.size = Pt(28)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x99, 0x33)
+    growth_box.text_frame.word_wrap = True
+    _set_text(growth_box, [
+        ("Growth Rate", PT14, False, GRAY, PP_ALIGN.CENTER),
+        ("25.5%", PT28, True, GREEN, PP_ALIGN.CENTER),
+    ])
 
     # Growth Rate Value shape (separate for easy updates)
     growth_value = slide2.shapes.add_textbox(Inches(4), Inches(2.0), Inches(3), Inches(0.6))
     growth_value.name = "GrowthValue"
-    tf = growth_value.text_frame
-    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "25.5%"
-    run.font.size = Pt(24)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x99, 0x33)
+    _set_text(growth_value, [("25.5%", PT24, True, GREEN, PP_ALIGN.CENTER)])
 
     # Customer Count shape
     customers_box = slide2.shapes.add_textbox(Inches(7.5), Inches(1.2), Inches(3), Inches(1.5))
     customers_box.name = "CustomerCount"
-    tf = customers_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = "Active Customers"
-    run.font.size = Pt(14)
-    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
-    run.font.name = "Arial"
-    p = tf.add_paragraph()
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = "1,250"
-    run.font.size = Pt(28)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x33, 0x66)
+    customers_box.text_frame.word_wrap = True
+    _set_text(customers_box, [
+        ("Active Customers", PT14, False, GRAY, PP_ALIGN.CENTER),
+        ("1,250", PT28, True, NAVY, PP_ALIGN.CENTER),
+    ])
 
     # Customer Value shape (separate for updates)
     customer_value = slide2.shapes.add_textbox(Inches(7.5), Inches(2.0), Inches(3), Inches(0.6))
     customer_value.name = "CustomerValue"
-    tf = customer_value.text_frame
-    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "1,250"
-    run.font.size = Pt(24)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x33, 0x66)
+    _set_text(customer_value, [("1,250", PT24, True, NAVY, PP_ALIGN.CENTER)])
 
     # =========================================================================
     # Slide 3: Financial Table
@@ -181,14 +169,7 @@ def create_sample_presentation(output_path: str = None):
     # Section title
     section_title = slide3.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.333), Inches(0.6))
     section_title.name = "FinancialTitle"
-    tf = section_title.text_frame
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Financial Summary"
-    run.font.size = Pt(28)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x33, 0x66)
+    _set_text(section_title, [("Financial Summary", PT28, True, NAVY, None)])
 
     # Create a table
     rows, cols = 5, 4
@@ -208,11 +189,11 @@ def create_sample_presentation(output_path: str = None):
         cell = table.cell(0, col)
         cell.text = header
         cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(0x00, 0x33, 0x66)
+        cell.fill.fore_color.rgb = NAVY
         para = cell.text_frame.paragraphs[0]
-        para.font.size = Pt(14)
+        para.font.size = PT14
         para.font.bold = True
-        para.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+        para.font.color.rgb = WHITE
         para.font.name = "Arial"
 
     # Data rows
@@ -228,13 +209,13 @@ def create_sample_presentation(output_path: str = None):
             cell = table.cell(row_idx, col_idx)
             cell.text = cell_value
             para = cell.text_frame.paragraphs[0]
-            para.font.size = Pt(12)
+            para.font.size = PT12
             para.font.name = "Arial"
             if col_idx == 0:
                 para.font.bold = True
-                para.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
+                para.font.color.rgb = DARK
             else:
-                para.font.color.rgb = RGBColor(0x00, 0x00, 0x00)
+                para.font.color.rgb = BLACK
 
     # =========================================================================
     # Slide 4: KPI Table
@@ -244,14 +225,7 @@ def create_sample_presentation(output_path: str = None):
     # Section title
     section_title = slide4.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.333), Inches(0.6))
     section_title.name = "KPITitle"
-    tf = section_title.text_frame
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Key Performance Indicators"
-    run.font.size = Pt(28)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x33, 0x66)
+    _set_text(section_title, [("Key Performance Indicators", PT28, True, NAVY, None)])
 
     # KPI Table
     rows, cols = 6, 3
@@ -270,11 +244,11 @@ def create_sample_presentation(output_path: str = None):
         cell = kpi_table.cell(0, col)
         cell.text = header
         cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(0x00, 0x66, 0x99)
+        cell.fill.fore_color.rgb = OCEAN
         para = cell.text_frame.paragraphs[0]
-        para.font.size = Pt(14)
+        para.font.size = PT14
         para.font.bold = True
-        para.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+        para.font.color.rgb = WHITE
         para.font.name = "Arial"
 
     # KPI Data
@@ -291,7 +265,7 @@ def create_sample_presentation(output_path: str = None):
             cell = kpi_table.cell(row_idx, col_idx)
             cell.text = cell_value
             para = cell.text_frame.paragraphs[0]
-            para.font.size = Pt(12)
+            para.font.size = PT12
             para.font.name = "Arial"
             if col_idx == 0:
                 para.font.bold = True
@@ -304,93 +278,64 @@ def create_sample_presentation(output_path: str = None):
     # Section title
     section_title = slide5.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.333), Inches(0.6))
     section_title.name = "SummaryTitle"
-    tf = section_title.text_frame
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Executive Summary"
-    run.font.size = Pt(28)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x33, 0x66)
+    _set_text(section_title, [("Executive Summary", PT28, True, NAVY, None)])
 
     # Period text
     period_box = slide5.shapes.add_textbox(Inches(0.5), Inches(1.2), Inches(6), Inches(0.5))
     period_box.name = "ReportPeriod"
-    tf = period_box.text_frame
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Reporting Period: Q4 2024"
-    run.font.size = Pt(16)
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+    _set_text(period_box, [("Reporting Period: Q4 2024", PT16, False, GRAY, None)])
 
     # Total Revenue box
     total_revenue = slide5.shapes.add_textbox(Inches(0.5), Inches(2.0), Inches(4), Inches(0.8))
     total_revenue.name = "TotalRevenue"
-    tf = total_revenue.text_frame
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Total Revenue: $5,000,000"
-    run.font.size = Pt(18)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x33, 0x66)
+    _set_text(total_revenue, [("Total Revenue: $5,000,000", PT18, True, NAVY, None)])
 
     # YoY Growth box
     yoy_growth = slide5.shapes.add_textbox(Inches(0.5), Inches(2.8), Inches(4), Inches(0.8))
     yoy_growth.name = "YoYGrowth"
-    tf = yoy_growth.text_frame
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Year-over-Year Growth: 25.5%"
-    run.font.size = Pt(18)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x99, 0x33)
+    _set_text(yoy_growth, [("Year-over-Year Growth: 25.5%", PT18, True, GREEN, None)])
 
     # Customer count summary
     customer_summary = slide5.shapes.add_textbox(Inches(0.5), Inches(3.6), Inches(4), Inches(0.8))
     customer_summary.name = "CustomerSummary"
-    tf = customer_summary.text_frame
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Total Customers: 1,250"
-    run.font.size = Pt(18)
-    run.font.bold = True
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x00, 0x33, 0x66)
+    _set_text(customer_summary, [("Total Customers: 1,250", PT18, True, NAVY, None)])
 
     # Inception date
     inception_date = slide5.shapes.add_textbox(Inches(7), Inches(2.0), Inches(5), Inches(0.5))
     inception_date.name = "InceptionDate"
-    tf = inception_date.text_frame
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Fund Inception: April 1, 2021"
-    run.font.size = Pt(14)
-    run.font.name = "Arial"
-    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+    _set_text(inception_date, [("Fund Inception: April 1, 2021", PT14, False, GRAY, None)])
 
     # Save the presentation
     output = Path(output_path)
-    prs.save(str(output))
+    if compress:
+        prs.save(str(output))
+    else:
+        with _stored_zip_writes():
+            prs.save(str(output))
     print(f"Created sample presentation: {output.absolute()}")
 
-    # Print shape inventory for reference
-    print("\n" + "=" * 60)
-    print("SHAPE INVENTORY FOR TESTING")
-    print("=" * 60)
+    # Print shape inventory for reference, collected and written in one go
+    lines = ["\n" + "=" * 60, "SHAPE INVENTORY FOR TESTING", "=" * 60]
 
     for slide_idx, slide in enumerate(prs.slides, start=1):
-        print(f"\nSlide {slide_idx}:")
+        lines.append(f"\nSlide {slide_idx}:")
         for shape in slide.shapes:
-            shape_type = "TABLE" if shape.has_table else "TEXT" if shape.has_text_frame else "OTHER"
+            # Each of these properties walks the shape XML, so read them once
             text_preview = ""
-            if shape.has_text_frame and shape.text_frame.text:
-                text_preview = f' -> "{shape.text_frame.text[:30]}..."' if len(shape.text_frame.text) > 30 else f' -> "{shape.text_frame.text}"'
             if shape.has_table:
-                text_preview = f' ({len(shape.table.rows)}x{len(shape.table.columns)} table)'
-            print(f"  - {shape.name} [{shape_type}]{text_preview}")
+                shape_type = "TABLE"
+                table = shape.table
+                text_preview = f' ({len(table.rows)}x{len(table.columns)} table)'
+            elif shape.has_text_frame:
+                shape_type = "TEXT"
+                text = shape.text_frame.text
+                if text:
+                    text_preview = f' -> "{text[:30]}..."' if len(text) > 30 else f' -> "{text}"'
+            else:
+                shape_type = "OTHER"
+            lines.append(f"  - {shape.name} [{shape_type}]{text_preview}")
+
+    print("\n".join(lines))
 
     return str(output.absolute())
 
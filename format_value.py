@@ -4,14 +4,57 @@ Converts raw values from Google Sheets into formatted strings for Keynote displa
 """
 
 import logging
-from datetime import datetime, timedelta
+import re
+from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
+# Cached result of logger.isEnabledFor(DEBUG); refreshed by set_debug_enabled()
+_debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
 # Google Sheets epoch (dates are stored as days since this date)
 SHEETS_EPOCH = datetime(1899, 12, 30)
+_SHEETS_EPOCH_ORDINAL = SHEETS_EPOCH.toordinal()
+
+# Date string shapes and the strptime formats to try for each, so a string is
+# only handed to strptime for formats it could plausibly match
+_DATE_DISPATCH = [
+    (re.compile(r'\d{4}-\d{1,2}-\s?\d{1,2}$'), ('%Y-%m-%d',)),
+    (re.compile(r'\d{1,2}/\s?\d{1,2}/\d{4}$'), ('%m/%d/%Y', '%d/%m/%Y')),
+    (re.compile(r'\w+\s+\d{1,2},\s+\d{4}$'), ('%B %d, %Y',)),
+]
+_SHORT_DATE_DISPATCH = _DATE_DISPATCH[:2]
+
+# Precomputed format specs by decimal places for the numeric formatters
+_CURRENCY_SPECS = {0: ',.0f', 1: ',.1f', 2: ',.2f'}
+_PERCENT_SPECS = {0: '.0f', 1: '.1f', 2: '.2f'}
+_DECIMAL_SPECS = {0: ',.0f', 1: ',.1f', 2: ',.2f'}
+
+# Word forms for format_text_number, indexed by value
+_NUMBER_WORDS = (
+    'Zero', 'One', 'Two', 'Three', 'Four', 'Five', 'Six', 'Seven', 'Eight', 'Nine',
+    'Ten', 'Eleven', 'Twelve', 'Thirteen', 'Fourteen', 'Fifteen', 'Sixteen',
+    'Seventeen', 'Eighteen', 'Nineteen', 'Twenty',
+)
+
+# Formatting characters stripped from numeric strings in a single pass
+_STRIP_TABLE = str.maketrans('', '', ',$% ')
+
+
+def set_debug_enabled(enabled: Optional[bool] = None) -> None:
+    """
+    Turn per-value debug logging on or off.
+
+    Call this after reconfiguring logging so the cached level check is updated.
+
+    Args:
+        enabled: Force debug logging on or off; None re-reads the logger level
+    """
+    global _debug_enabled
+    _debug_enabled = logger.isEnabledFor(logging.DEBUG) if enabled is None else enabled
 
 
 def parse_number(value: Any) -> Optional[float]:
@@ -27,16 +70,20 @@ def parse_number(value: Any) -> Optional[float]:
     if value is None:
         return None
 
+    # Sheets cells are almost always plain floats or ints, so check exact types first
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+
+    # bool and other int/float subclasses
     if isinstance(value, (int, float)):
         return float(value)
 
     if isinstance(value, str):
         # Remove common formatting characters
-        cleaned = value.strip()
-        cleaned = cleaned.replace(',', '')
-        cleaned = cleaned.replace('$', '')
-        cleaned = cleaned.replace('%', '')
-        cleaned = cleaned.replace(' ', '')
+        cleaned = value.strip().translate(_STRIP_TABLE)
 
         # Handle parentheses for negative numbers
         if cleaned.startswith('(') and cleaned.endswith(')'):
@@ -62,12 +109,7 @@ def format_currency(value: float, decimals: int = 0, symbol: str = '$') -> str:
     Returns:
         Formatted currency string (e.g., "$5,000" or "$5,000.00")
     """
-    if decimals == 0:
-        formatted = f"{abs(value):,.0f}"
-    elif decimals == 1:
-        formatted = f"{abs(value):,.1f}"
-    else:
-        formatted = f"{abs(value):,.2f}"
+    formatted = format(abs(value), _CURRENCY_SPECS.get(decimals, ',.2f'))
 
     if value < 0:
         return f"-{symbol}{formatted}"
@@ -89,12 +131,8 @@ def format_percent(value: float, decimals: int = 1, multiply: bool = False) -> s
     if multiply:
         value = value * 100
 
-    if decimals == 0:
-        return f"{value:.0f}%"
-    elif decimals == 1:
-        return f"{value:.1f}%"
-    else:
-        return f"{value:.{decimals}f}%"
+    spec = _PERCENT_SPECS.get(decimals) or f".{decimals}f"
+    return format(value, spec) + '%'
 
 
 def format_integer(value: float) -> str:
@@ -107,7 +145,7 @@ def format_integer(value: float) -> str:
     Returns:
         Formatted integer string (e.g., "10,000")
     """
-    return f"{int(round(value)):,}"
+    return f"{round(value):,}"
 
 
 def format_decimal(value: float, decimals: int = 2) -> str:
@@ -121,7 +159,31 @@ def format_decimal(value: float, decimals: int = 2) -> str:
     Returns:
         Formatted decimal string (e.g., "5.00")
     """
-    return f"{value:,.{decimals}f}"
+    spec = _DECIMAL_SPECS.get(decimals) or f",.{decimals}f"
+    return format(value, spec)
+
+
+def _parse_date_string(value: str, dispatch: list) -> Optional[datetime]:
+    """
+    Parse a date string using the first dispatch entry whose pattern matches.
+
+    Args:
+        value: The date string
+        dispatch: List of (pattern, formats) pairs to try
+
+    Returns:
+        Parsed datetime or None if the string is not a recognized date.
+    """
+    cleaned = value.strip()
+    for pattern, formats in dispatch:
+        if pattern.match(cleaned):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(cleaned, fmt)
+                except ValueError:
+                    continue
+            return None
+    return None
 
 
 def format_date_mdy(value: Any) -> str:
@@ -141,17 +203,12 @@ def format_date_mdy(value: Any) -> str:
     elif isinstance(value, (int, float)):
         # Google Sheets stores dates as serial numbers (days since epoch)
         try:
-            date_obj = SHEETS_EPOCH + timedelta(days=int(value))
+            date_obj = datetime.fromordinal(_SHEETS_EPOCH_ORDINAL + int(value))
         except (ValueError, OverflowError):
             pass
     elif isinstance(value, str):
         # Try common date formats
-        for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%B %d, %Y']:
-            try:
-                date_obj = datetime.strptime(value.strip(), fmt)
-                break
-            except ValueError:
-                continue
+        date_obj = _parse_date_string(value, _DATE_DISPATCH)
 
     if date_obj:
         # Use platform-independent formatting (%-d doesn't work on Windows)
@@ -178,16 +235,11 @@ def format_date_short(value: Any) -> str:
         date_obj = value
     elif isinstance(value, (int, float)):
         try:
-            date_obj = SHEETS_EPOCH + timedelta(days=int(value))
+            date_obj = datetime.fromordinal(_SHEETS_EPOCH_ORDINAL + int(value))
         except (ValueError, OverflowError):
             pass
     elif isinstance(value, str):
-        for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']:
-            try:
-                date_obj = datetime.strptime(value.strip(), fmt)
-                break
-            except ValueError:
-                continue
+        date_obj = _parse_date_string(value, _SHORT_DATE_DISPATCH)
 
     if date_obj:
         return f"{date_obj.month}/{date_obj.year}"
@@ -205,23 +257,70 @@ def format_text_number(value: Any) -> str:
     Returns:
         Number as word (e.g., 10 -> "Ten")
     """
-    number_words = {
-        0: 'Zero', 1: 'One', 2: 'Two', 3: 'Three', 4: 'Four',
-        5: 'Five', 6: 'Six', 7: 'Seven', 8: 'Eight', 9: 'Nine',
-        10: 'Ten', 11: 'Eleven', 12: 'Twelve', 13: 'Thirteen',
-        14: 'Fourteen', 15: 'Fifteen', 16: 'Sixteen', 17: 'Seventeen',
-        18: 'Eighteen', 19: 'Nineteen', 20: 'Twenty'
-    }
-
     num = parse_number(value)
     if num is not None:
-        int_val = int(round(num))
-        if int_val in number_words:
-            return number_words[int_val]
+        int_val = round(num)
+        if 0 <= int_val < len(_NUMBER_WORDS):
+            return _NUMBER_WORDS[int_val]
 
     return str(value)
 
 
+def _numeric(formatter: Callable[[float], str]) -> Callable[[Any], str]:
+    """Wrap a numeric formatter so values that don't parse as numbers pass through as text."""
+    def handler(raw_value: Any) -> str:
+        num = parse_number(raw_value)
+        if num is None:
+            return str(raw_value)
+        return formatter(num)
+    return handler
+
+
+def _percent_auto_mul(num: float) -> bool:
+    """Check if value is a decimal fraction (0.133) rather than already a percentage (13.3)."""
+    magnitude = abs(num)
+    return 0 < magnitude <= 1
+
+
+def _auto_percent(decimals: int) -> Callable[[float], str]:
+    """Percent formatter that scales decimal fractions but not whole percentages."""
+    def formatter(num: float) -> str:
+        return format_percent(num, decimals=decimals, multiply=_percent_auto_mul(num))
+    return formatter
+
+
+# Format type -> handler taking the raw value; unknown formats fall back to str()
+_FORMATTERS = {
+    'currency0': _numeric(partial(format_currency, decimals=0)),
+    'currency1': _numeric(partial(format_currency, decimals=1)),
+    'currency2': _numeric(partial(format_currency, decimals=2)),
+    'percent0': _numeric(_auto_percent(0)),
+    'percent1': _numeric(_auto_percent(1)),
+    'percent2': _numeric(_auto_percent(2)),
+    'integer': _numeric(format_integer),
+    'decimal1': _numeric(partial(format_decimal, decimals=1)),
+    'decimal2': _numeric(partial(format_decimal, decimals=2)),
+    'date_mdy': format_date_mdy,
+    'date_short': format_date_short,
+    'text_number': format_text_number,
+    'text': str,
+}
+
+
+def _normalize_fmt(fmt: Optional[str]) -> str:
+    """Normalize a format type name."""
+    return fmt.lower().strip() if fmt else 'text'
+
+
+def _apply_formatter(handler: Callable[[Any], str], raw_value: Any, fmt: str) -> str:
+    """Run a format handler, falling back to the raw text if it raises."""
+    try:
+        return handler(raw_value)
+    except Exception as e:
+        logger.warning(f"Error formatting value '{raw_value}' with format '{fmt}': {e}")
+        return str(raw_value)
+
+
 def format_value(raw_value: Any, fmt: str, prefix: str = '', suffix: str = '',
                  empty_value: str = '') -> str:
     """
@@ -238,104 +337,65 @@ def format_value(raw_value: Any, fmt: str, prefix: str = '', suffix: str = '',
     Returns:
         Formatted string ready for Keynote display.
     """
-    # Handle empty values
+    fmt = _normalize_fmt(fmt)
+    return _format_with(_FORMATTERS.get(fmt, str), fmt, raw_value, prefix, suffix, empty_value)
+
+
+def _format_with(handler: Callable[[Any], str], fmt: str, raw_value: Any, prefix: str, suffix: str,
+                 empty_value: str) -> str:
+    """Format one value with an already looked-up handler; shared by format_value and resolve_formatter."""
     if raw_value is None or (isinstance(raw_value, str) and raw_value.strip() == ''):
         return empty_value
+    final_result = _apply_formatter(handler, raw_value, fmt)
+    # Note: For currency formats, the $ is already included, so prefix should be empty
+    # unless the user wants additional text
+    if prefix or suffix:
+        final_result = f"{prefix}{final_result}{suffix}"
+    if _debug_enabled:
+        logger.debug("Formatted %r with %r -> %r", raw_value, fmt, final_result)
+    return final_result
 
-    fmt = fmt.lower().strip() if fmt else 'text'
-    result = ''
 
-    try:
-        if fmt == 'currency0':
-            num = parse_number(raw_value)
-            if num is not None:
-                result = format_currency(num, decimals=0)
-            else:
-                result = str(raw_value)
-
-        elif fmt == 'currency1':
-            num = parse_number(raw_value)
-            if num is not None:
-                result = format_currency(num, decimals=1)
-            else:
-                result = str(raw_value)
-
-        elif fmt == 'currency2':
-            num = parse_number(raw_value)
-            if num is not None:
-                result = format_currency(num, decimals=2)
-            else:
-                result = str(raw_value)
-
-        elif fmt == 'percent0':
-            num = parse_number(raw_value)
-            if num is not None:
-                # Check if value is already in percentage form (> 1) or decimal (< 1)
-                multiply = abs(num) <= 1 and abs(num) > 0
-                result = format_percent(num, decimals=0, multiply=multiply)
-            else:
-                result = str(raw_value)
-
-        elif fmt == 'percent1':
-            num = parse_number(raw_value)
-            if num is not None:
-                multiply = abs(num) <= 1 and abs(num) > 0
-                result = format_percent(num, decimals=1, multiply=multiply)
-            else:
-                result = str(raw_value)
-
-        elif fmt == 'percent2':
-            num = parse_number(raw_value)
-            if num is not None:
-                multiply = abs(num) <= 1 and abs(num) > 0
-                result = format_percent(num, decimals=2, multiply=multiply)
-            else:
-                result = str(raw_value)
-
-        elif fmt == 'integer':
-            num = parse_number(raw_value)
-            if num is not None:
-                result = format_integer(num)
-            else:
-                result = str(raw_value)
-
-        elif fmt == 'decimal1':
-            num = parse_number(raw_value)
-            if num is not None:
-                result = format_decimal(num, decimals=1)
-            else:
-                result = str(raw_value)
-
-        elif fmt == 'decimal2':
-            num = parse_number(raw_value)
-            if num is not None:
-                result = format_decimal(num, decimals=2)
-            else:
-                result = str(raw_value)
-
-        elif fmt == 'date_mdy':
-            result = format_date_mdy(raw_value)
-
-        elif fmt == 'date_short':
-            result = format_date_short(raw_value)
-
-        elif fmt == 'text_number':
-            result = format_text_number(raw_value)
-
-        else:  # 'text' or unknown format
-            result = str(raw_value)
+@lru_cache(maxsize=256)
+def resolve_formatter(fmt: str, prefix: str = '', suffix: str = '',
+                      empty_value: str = '') -> Callable[[Any], str]:
+    """
+    Specialize format_value for one format type, prefix, suffix and empty value.
 
-    except Exception as e:
-        logger.warning(f"Error formatting value '{raw_value}' with format '{fmt}': {e}")
-        result = str(raw_value)
+    The format type is normalized and its handler looked up once; the returned
+    callable takes only the raw value and gives the same result as format_value.
+    The most recently used formatters are cached, so batch callers can resolve
+    per mapping or per column freely.
+    """
+    fmt = _normalize_fmt(fmt)
+    handler = _FORMATTERS.get(fmt, str)
 
-    # Apply prefix and suffix
-    # Note: For currency formats, the $ is already included, so prefix should be empty
-    # unless the user wants additional text
-    final_result = f"{prefix}{result}{suffix}"
+    def formatter(raw_value: Any) -> str:
+        return _format_with(handler, fmt, raw_value, prefix, suffix, empty_value)
 
-    logger.debug(f"Formatted '{raw_value}' with '{fmt}' -> '{final_result}'")
-    return final_result
+    return formatter
+
+
+def format_values_bulk(raw_values: Iterable[Any], fmt: str, prefix: str = '', suffix: str = '',
+                       empty_value: str = '') -> list[str]:
+    """
+    Format a column of raw values that all share the same format type.
+
+    Equivalent to calling format_value on each value, but the formatter is
+    resolved once for the whole column.
+
+    Args:
+        raw_values: The raw values from Google Sheets
+        fmt: Format type (see format_value)
+        prefix: Text to prepend to each result
+        suffix: Text to append to each result
+        empty_value: Value to use for empty/None entries
+
+    Returns:
+        List of formatted strings, in the same order as raw_values.
+    """
+    formatter = resolve_formatter(fmt, prefix, suffix, empty_value)
+    return [formatter(raw_value) for raw_value in raw_values]
 
 
 # Format type descriptions for documentation
@@ -5,30 +5,135 @@ Works on both Windows and macOS.
 """
 
 import logging
+import shutil
+from collections import namedtuple
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional, Dict, List, Tuple
+from typing import Any, Optional, Dict, Iterable, List, Set, Tuple
 
 from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.package import PartFactory
+from pptx.oxml import parse_xml
+from pptx.parts.slide import SlidePart
 from pptx.util import Pt
 
 logger = logging.getLogger(__name__)
 
 
+# MSO_SHAPE_TYPE member -> str(); the enum's __str__ formats on every call
+_SHAPE_TYPE_STR: Dict[Any, str] = {}
+
+
+def _shape_type_str(shape_type) -> str:
+    text = _SHAPE_TYPE_STR.get(shape_type)
+    if text is None:
+        text = _SHAPE_TYPE_STR[shape_type] = str(shape_type)
+    return text
+
+
+FontSnapshot = namedtuple('FontSnapshot', 'name size bold italic color')
+
+
+def _snapshot_font(run) -> FontSnapshot:
+    font = run.font
+    color = None
+    try:
+        color = font.color.rgb or None
+    except Exception:
+        # Theme or unset colors have no rgb value
+        pass
+    return FontSnapshot(font.name, font.size, font.bold, font.italic, color)
+
+
+def _replace_first_run_text(paragraph, new_text: str):
+    """Replace a paragraph's runs with new_text, keeping the first run's font."""
+    snap = _snapshot_font(paragraph.runs[0])
+    paragraph.clear()
+    run = paragraph.add_run()
+    run.text = new_text
+    # run.font adds an <a:rPr> element, so only touch it when there is something to restore
+    if snap.name:
+        run.font.name = snap.name
+    if snap.size:
+        run.font.size = snap.size
+    if snap.bold is not None:
+        run.font.bold = snap.bold
+    if snap.italic is not None:
+        run.font.italic = snap.italic
+    if snap.color:
+        run.font.color.rgb = snap.color
+
+
+class _LazySlidePart(SlidePart):
+    """SlidePart that keeps its XML as bytes until something reads the slide."""
+
+    def __init__(self, partname, content_type, package, element=None, blob=None):
+        self._xml_blob = blob
+        super().__init__(partname, content_type, package, element)
+
+    @classmethod
+    def load(cls, partname, content_type, package, blob):
+        return cls(partname, content_type, package, blob=blob)
+
+    @property
+    def _element(self):
+        if self._parsed_element is None:
+            self._parsed_element = parse_xml(self._xml_blob)
+            self._xml_blob = None
+        return self._parsed_element
+
+    @_element.setter
+    def _element(self, element):
+        self._parsed_element = element
+
+    @property
+    def blob(self) -> bytes:
+        # Untouched slides are written back exactly as they were read
+        if self._parsed_element is None:
+            return self._xml_blob
+        return super().blob
+
+
+@contextmanager
+def _lazy_slide_parts():
+    """Load slide parts as _LazySlidePart while a presentation is being opened."""
+    part_types = PartFactory.part_type_for
+    original = part_types.get(CT.PML_SLIDE)
+    part_types[CT.PML_SLIDE] = _LazySlidePart
+    try:
+        yield
+    finally:
+        part_types[CT.PML_SLIDE] = original
+
+
 class PowerPointBridge:
     """Bridge for reading and updating PowerPoint presentations."""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, lazy: bool = False):
         self.file_path = Path(file_path)
+        # lazy: only parse the XML of slides that are actually read or updated
+        self.lazy = lazy
         self.presentation = None
-        self._shape_cache = {}
-        self._table_cache = {}
+        # slide index -> {name: shape/table}; built for every slide in open()
+        # unless lazy, in which case each slide is indexed on first lookup
+        self._shape_index: Dict[int, Dict[str, Any]] = {}
+        self._table_index: Dict[int, Dict[str, Any]] = {}
+        # 1-based indexes of slides whose XML an update actually changed
+        self._dirty_slides: Set[int] = set()
 
     def open(self) -> bool:
         try:
             if not self.file_path.exists():
                 logger.error(f"PowerPoint file not found: {self.file_path}")
                 return False
-            self.presentation = Presentation(str(self.file_path))
+            if self.lazy:
+                with _lazy_slide_parts():
+                    self.presentation = Presentation(str(self.file_path))
+            else:
+                self.presentation = Presentation(str(self.file_path))
+            self._dirty_slides = set()
+            self._build_indexes()
             logger.info(f"Opened PowerPoint: {self.file_path}")
             logger.info(f"Slides: {len(self.presentation.slides)}")
             return True
@@ -39,7 +144,15 @@ class PowerPointBridge:
     def save(self, output_path: Optional[str] = None) -> bool:
         try:
             save_path = output_path or str(self.file_path)
+            if not self._dirty_slides:
+                # Nothing changed since open(): the file on disk is already what we'd write
+                if Path(save_path).resolve() != self.file_path.resolve():
+                    shutil.copyfile(self.file_path, save_path)
+                logger.info(f"No changes; PowerPoint unchanged at: {save_path}")
+                return True
             self.presentation.save(save_path)
+            if Path(save_path).resolve() == self.file_path.resolve():
+                self._dirty_slides = set()
             logger.info(f"Saved PowerPoint to: {save_path}")
             return True
         except Exception as e:
@@ -59,33 +172,66 @@ class PowerPointBridge:
             return None
         return self.presentation.slides[slide_index - 1]
 
+    def _build_indexes(self):
+        self._shape_index = {}
+        self._table_index = {}
+        if self.lazy:
+            return
+        for slide_index, slide in enumerate(self.presentation.slides, start=1):
+            self._index_slide(slide_index, slide)
+
+    def _index_slide(self, slide_index: int, slide):
+        # One pass over the slide's shapes; the first shape with a given name wins
+        shapes = {}
+        tables = {}
+        for shape in slide.shapes:
+            shapes.setdefault(shape.name, shape)
+            if shape.name not in tables and shape.has_table:
+                tables[shape.name] = shape.table
+        self._shape_index[slide_index] = shapes
+        self._table_index[slide_index] = tables
+
+    def index_slides(self, slide_indexes: Iterable[int]):
+        """
+        Index the given slides now instead of on their first lookup.
+
+        Useful in lazy mode to parse just the slides a batch will touch. Slides
+        that are already indexed or out of range are skipped.
+        """
+        if self.presentation is None:
+            return
+        slide_count = len(self.presentation.slides)
+        for slide_index in slide_indexes:
+            if slide_index not in self._shape_index and 1 <= slide_index <= slide_count:
+                self._index_slide(slide_index, self.presentation.slides[slide_index - 1])
+
+    def _names_on_slide(self, index: Dict[int, Dict[str, Any]], slide_index: int) -> Optional[Dict[str, Any]]:
+        names = index.get(slide_index)
+        if names is None:
+            slide = self._get_slide(slide_index)
+            if slide is None:
+                return None
+            self._index_slide(slide_index, slide)
+            names = index[slide_index]
+        return names
+
     def _find_shape_by_name(self, slide_index: int, shape_name: str):
-        cache_key = (slide_index, shape_name)
-        if cache_key in self._shape_cache:
-            return self._shape_cache[cache_key]
-        slide = self._get_slide(slide_index)
-        if slide is None:
+        shapes = self._names_on_slide(self._shape_index, slide_index)
+        if shapes is None:
             return None
-        for shape in slide.shapes:
-            if shape.name == shape_name:
-                self._shape_cache[cache_key] = shape
-                return shape
-        logger.warning(f"Shape '{shape_name}' not found on slide {slide_index}")
-        return None
+        shape = shapes.get(shape_name)
+        if shape is None:
+            logger.warning(f"Shape '{shape_name}' not found on slide {slide_index}")
+        return shape
 
     def _find_table_by_name(self, slide_index: int, table_name: str):
-        cache_key = (slide_index, table_name)
-        if cache_key in self._table_cache:
-            return self._table_cache[cache_key]
-        slide = self._get_slide(slide_index)
-        if slide is None:
+        tables = self._names_on_slide(self._table_index, slide_index)
+        if tables is None:
             return None
-        for shape in slide.shapes:
-            if shape.name == table_name and shape.has_table:
-                self._table_cache[cache_key] = shape.table
-                return shape.table
-        logger.warning(f"Table '{table_name}' not found on slide {slide_index}")
-        return None
+        table = tables.get(table_name)
+        if table is None:
+            logger.warning(f"Table '{table_name}' not found on slide {slide_index}")
+        return table
 
     def update_shape_text(self, slide_index: int, shape_name: str, new_text: str) -> Tuple[bool, str]:
         try:
@@ -95,37 +241,18 @@ class PowerPointBridge:
             if not shape.has_text_frame:
                 return False, f"Shape '{shape_name}' does not contain text"
             text_frame = shape.text_frame
+            if text_frame.text == new_text:
+                # Rebuilding the runs would only dirty the slide XML
+                return True, f"Shape '{shape_name}' on slide {slide_index} already up to date"
             if text_frame.paragraphs:
                 first_para = text_frame.paragraphs[0]
                 if first_para.runs:
-                    first_run = first_para.runs[0]
-                    font_name = first_run.font.name
-                    font_size = first_run.font.size
-                    font_bold = first_run.font.bold
-                    font_italic = first_run.font.italic
-                    font_color = None
-                    try:
-                        if first_run.font.color and first_run.font.color.rgb:
-                            font_color = first_run.font.color.rgb
-                    except:
-                        pass
-                    first_para.clear()
-                    run = first_para.add_run()
-                    run.text = new_text
-                    if font_name:
-                        run.font.name = font_name
-                    if font_size:
-                        run.font.size = font_size
-                    if font_bold is not None:
-                        run.font.bold = font_bold
-                    if font_italic is not None:
-                        run.font.italic = font_italic
-                    if font_color:
-                        run.font.color.rgb = font_color
+                    _replace_first_run_text(first_para, new_text)
                 else:
                     first_para.text = new_text
             else:
                 text_frame.text = new_text
+            self._dirty_slides.add(slide_index)
             return True, f"Updated shape '{shape_name}' on slide {slide_index}"
         except Exception as e:
             logger.error(f"Error updating shape: {e}")
@@ -142,34 +269,17 @@ class PowerPointBridge:
             if col_idx < 0 or col_idx >= len(table.columns):
                 return False, f"Column {col} out of range"
             cell = table.cell(row_idx, col_idx)
+            if cell.text == new_text:
+                return True, f"Cell ({row},{col}) in '{table_name}' already up to date"
             if cell.text_frame.paragraphs:
                 first_para = cell.text_frame.paragraphs[0]
                 if first_para.runs:
-                    first_run = first_para.runs[0]
-                    font_name = first_run.font.name
-                    font_size = first_run.font.size
-                    font_bold = first_run.font.bold
-                    font_color = None
-                    try:
-                        if first_run.font.color and first_run.font.color.rgb:
-                            font_color = first_run.font.color.rgb
-                    except:
-                        pass
-                    first_para.clear()
-                    run = first_para.add_run()
-                    run.text = new_text
-                    if font_name:
-                        run.font.name = font_name
-                    if font_size:
-                        run.font.size = font_size
-                    if font_bold is not None:
-                        run.font.bold = font_bold
-                    if font_color:
-                        run.font.color.rgb = font_color
+                    _replace_first_run_text(first_para, new_text)
                 else:
                     first_para.text = new_text
             else:
                 cell.text = new_text
+            self._dirty_slides.add(slide_index)
             return True, f"Updated cell ({row},{col}) in '{table_name}'"
         except Exception as e:
             return False, str(e)
@@ -182,7 +292,7 @@ class PowerPointBridge:
         for shape in slide.shapes:
             info = {
                 'name': shape.name,
-                'type': str(shape.shape_type),
+                'type': _shape_type_str(shape.shape_type),
                 'has_text': shape.has_text_frame,
                 'has_table': shape.has_table
             }
@@ -4,23 +4,38 @@ Handles authentication and data fetching from Google Sheets.
 """
 
 import os
+import sys
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 
 # Google Sheets API scope - read-only access
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
 
+# batchGet ranges per request, and concurrent requests for large range lists
+BATCH_GET_CHUNK_SIZE = 100
+BATCH_GET_WORKERS = 4
+
 logger = logging.getLogger(__name__)
 
+# Parsed token files keyed by (path, mtime); a rewritten token file gets a new key
+_creds_cache: dict[tuple[str, float], Credentials] = {}
+
+# dataclass(slots=True) needs Python 3.10; on 3.9 rows fall back to a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class MappingRow:
     """Represents a single mapping row from KeynoteMap sheet."""
     id: str
@@ -35,39 +50,71 @@ class MappingRow:
     suffix: str = ''
     notes: str = ''
 
+    def __post_init__(self):
+        # These come from a small closed set and key dict lookups downstream;
+        # interning lets equal strings share one object (identity fast path)
+        for name in ('format', 'target_type', 'object_name'):
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
     @classmethod
     def from_row(cls, row: list) -> 'MappingRow':
         """Create a MappingRow from a spreadsheet row (list of cell values)."""
-        def get_cell(index: int, default: Any = '') -> Any:
-            try:
-                return row[index] if row[index] is not None else default
-            except IndexError:
-                return default
-
-        def get_int(index: int, default: Optional[int] = None) -> Optional[int]:
-            try:
-                val = row[index]
-                if val is None or val == '':
-                    return default
-                return int(float(val))
-            except (IndexError, ValueError, TypeError):
-                return default
+        # Pad/truncate once so every column is a plain local instead of an indexed lookup
+        (id_, sheet_range, slide_index, target_type, object_name,
+         row_index, col_index, fmt, prefix, suffix, notes) = (list(row) + [None] * 11)[:11]
 
         return cls(
-            id=str(get_cell(0, '')),
-            sheet_range=str(get_cell(1, '')),
-            slide_index=get_int(2, 1) or 1,
-            target_type=str(get_cell(3, 'shape')).lower(),
-            object_name=str(get_cell(4, '')),
-            row=get_int(5),
-            col=get_int(6),
-            format=str(get_cell(7, 'text')),
-            prefix=str(get_cell(8, '')),
-            suffix=str(get_cell(9, '')),
-            notes=str(get_cell(10, ''))
+            id=str('' if id_ is None else id_),
+            sheet_range=str('' if sheet_range is None else sheet_range),
+            slide_index=_to_int(slide_index, 1) or 1,
+            target_type=str('shape' if target_type is None else target_type).lower(),
+            object_name=str('' if object_name is None else object_name),
+            row=_to_int(row_index),
+            col=_to_int(col_index),
+            format=str('text' if fmt is None else fmt),
+            prefix=str('' if prefix is None else prefix),
+            suffix=str('' if suffix is None else suffix),
+            notes=str('' if notes is None else notes)
         )
 
 
+@lru_cache(maxsize=None)
+def _sheets_discovery_doc() -> Optional[str]:
+    """Read the Sheets v4 discovery document bundled with googleapiclient once per process."""
+    return get_static_doc('sheets', 'v4')
+
+
+def _build_sheets_service(creds: Credentials):
+    """Build a Sheets API service from the cached discovery document."""
+    doc = _sheets_discovery_doc()
+    if doc is None:
+        # Not bundled with this googleapiclient; let build() resolve it
+        return build('sheets', 'v4', credentials=creds)
+    # Pass the JSON string, not a parsed dict: building mutates the dict it's given
+    return build_from_document(doc, credentials=creds)
+
+
+def _parse_mapping_row(row_number: int, row: list) -> Optional[MappingRow]:
+    """Parse one mapping sheet row, logging and returning None if it is malformed."""
+    try:
+        return MappingRow.from_row(row)
+    except Exception as e:
+        logger.warning(f"Failed to parse mapping row {row_number}: {e}")
+        return None
+
+
+def _to_int(val: Any, default: Optional[int] = None) -> Optional[int]:
+    """Coerce a sheet cell to int (accepting "3" or "3.0"), falling back to default."""
+    if val is None or val == '':
+        return default
+    try:
+        return int(float(val))
+    except (ValueError, TypeError):
+        return default
+
+
 class SheetsClient:
     """Client for interacting with Google Sheets API."""
 
@@ -88,21 +135,29 @@ class SheetsClient:
         self.mapping_sheet = config.get('mapping_sheet', 'KeynoteMap')
         self._service = None
         self._creds = None
+        # Per-thread services for chunked batchGet; httplib2 objects aren't thread-safe
+        self._local = threading.local()
 
     def _get_credentials(self) -> Credentials:
         """Get or refresh OAuth credentials."""
         creds = None
+        cache_key = None
 
         # Load existing token if available
         if os.path.exists(self.token_file):
-            try:
-                creds = Credentials.from_authorized_user_file(self.token_file, SCOPES)
-                logger.debug("Loaded existing credentials from token file")
-            except Exception as e:
-                logger.warning(f"Failed to load token file: {e}")
+            cache_key = (self.token_file, os.path.getmtime(self.token_file))
+            creds = _creds_cache.get(cache_key)
+            if creds is None:
+                try:
+                    creds = Credentials.from_authorized_user_file(self.token_file, SCOPES)
+                    _creds_cache[cache_key] = creds
+                    logger.debug("Loaded existing credentials from token file")
+                except Exception as e:
+                    logger.warning(f"Failed to load token file: {e}")
 
         # If no valid credentials, initiate OAuth flow
         if not creds or not creds.valid:
+            _creds_cache.pop(cache_key, None)
             if creds and creds.expired and creds.refresh_token:
                 try:
                     creds.refresh(Request())
@@ -127,6 +182,7 @@ class SheetsClient:
             with open(self.token_file, 'w') as token:
                 token.write(creds.to_json())
                 logger.debug(f"Saved credentials to {self.token_file}")
+            _creds_cache[(self.token_file, os.path.getmtime(self.token_file))] = creds
 
         return creds
 
@@ -134,9 +190,25 @@ class SheetsClient:
         """Get or create the Sheets API service."""
         if self._service is None:
             self._creds = self._get_credentials()
-            self._service = build('sheets', 'v4', credentials=self._creds)
+            self._service = _build_sheets_service(self._creds)
         return self._service
 
+    def _thread_service(self):
+        """Get or create a Sheets API service owned by the calling worker thread."""
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = _build_sheets_service(self._creds)
+            self._local.service = service
+        return service
+
+    def _batch_get_chunk(self, ranges: list[str]) -> list[dict]:
+        """Run one batchGet for a chunk of ranges on the worker's own service."""
+        result = self._thread_service().spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=ranges
+        ).execute()
+        return result.get('valueRanges', [])
+
     def read_mapping(self) -> list[MappingRow]:
         """
         Read the mapping configuration from the KeynoteMap sheet.
@@ -160,22 +232,15 @@ class SheetsClient:
                 logger.warning(f"No mapping data found in {self.mapping_sheet}")
                 return []
 
-            mappings = []
-            for i, row in enumerate(values, start=2):
-                # Skip empty rows
-                if not row or not any(cell for cell in row):
-                    continue
-                # Skip rows without sheet_range (column B)
-                if len(row) < 2 or not row[1]:
-                    continue
-
-                try:
-                    mapping = MappingRow.from_row(row)
-                    mappings.append(mapping)
-                    logger.debug(f"Loaded mapping: {mapping.id} -> {mapping.object_name}")
-                except Exception as e:
-                    logger.warning(f"Failed to parse mapping row {i}: {e}")
+            # Sheet row numbers start at 2 (row 1 is the header); skip empty rows
+            # and rows without sheet_range (column B)
+            parsed = (_parse_mapping_row(i, row) for i, row in enumerate(values, start=2)
+                      if len(row) >= 2 and row[1])
+            mappings = [mapping for mapping in parsed if mapping is not None]
 
+            if logger.isEnabledFor(logging.DEBUG):
+                for mapping in mappings:
+                    logger.debug("Loaded mapping: %s -> %s", mapping.id, mapping.object_name)
             logger.info(f"Loaded {len(mappings)} mappings from {self.mapping_sheet}")
             return mappings
 
@@ -188,7 +253,7 @@ class SheetsClient:
 
     def batch_get_values(self, ranges: list[str]) -> dict[str, Any]:
         """
-        Fetch multiple cell values in a single API call.
+        Fetch multiple cell values with batchGet (chunked above BATCH_GET_CHUNK_SIZE ranges).
 
         Args:
             ranges: List of A1 notation ranges (e.g., ["Data Vault!B12", "Data Vault!C15"])
@@ -199,16 +264,26 @@ class SheetsClient:
         if not ranges:
             return {}
 
+        # Several mappings may show the same cell; fetch each range once
+        ranges = list(dict.fromkeys(ranges))
+
         try:
             service = self._get_service()
-            sheet = service.spreadsheets()
 
-            result = sheet.values().batchGet(
-                spreadsheetId=self.spreadsheet_id,
-                ranges=ranges
-            ).execute()
+            if len(ranges) <= BATCH_GET_CHUNK_SIZE:
+                result = service.spreadsheets().values().batchGet(
+                    spreadsheetId=self.spreadsheet_id,
+                    ranges=ranges
+                ).execute()
+                value_ranges = result.get('valueRanges', [])
+            else:
+                # Keep URLs short and overlap round-trips; map() preserves chunk order
+                chunks = [ranges[i:i + BATCH_GET_CHUNK_SIZE]
+                          for i in range(0, len(ranges), BATCH_GET_CHUNK_SIZE)]
+                with ThreadPoolExecutor(max_workers=min(BATCH_GET_WORKERS, len(chunks))) as pool:
+                    value_ranges = [vr for chunk in pool.map(self._batch_get_chunk, chunks)
+                                    for vr in chunk]
 
-            value_ranges = result.get('valueRanges', [])
             values_dict = {}
 
             for i, vr in enumerate(value_ranges):
@@ -219,7 +294,7 @@ class SheetsClient:
                     values_dict[range_key] = values[0][0]
                 else:
                     values_dict[range_key] = None
-                logger.debug(f"Fetched {range_key}: {values_dict[range_key]}")
+                logger.debug("Fetched %s: %s", range_key, values_dict[range_key])
 
             logger.info(f"Fetched {len(values_dict)} values from spreadsheet")
             return values_dict
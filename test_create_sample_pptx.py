@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for the sample deck generator.
+Tests that create_sample_pptx.py builds the checked-in sample presentation.
+"""
+
+import logging
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Add project directory to path
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from create_sample_pptx import create_sample_presentation
+
+
+def _deck_parts(path: Path) -> dict:
+    with zipfile.ZipFile(path) as z:
+        return {name: z.read(name) for name in z.namelist()}
+
+
+def test_matches_checked_in_deck(built_path: Path):
+    """Test that a fresh build has the same parts as sample_investor_deck.pptx."""
+    print("\n" + "=" * 60)
+    print("TEST: Checked-in sample deck")
+    print("=" * 60)
+
+    sample_path = script_dir / "sample_investor_deck.pptx"
+    assert _deck_parts(built_path) == _deck_parts(sample_path), \
+        "sample_investor_deck.pptx is out of date; re-run create_sample_pptx.py"
+
+    print("\nPASS: Checked-in sample deck")
+
+
+def test_uncompressed_build(built_path: Path, tmp_dir: Path):
+    """Test that compress=False only changes the zip compression, not the parts."""
+    print("\n" + "=" * 60)
+    print("TEST: Uncompressed build")
+    print("=" * 60)
+
+    stored_path = tmp_dir / "stored.pptx"
+    create_sample_presentation(str(stored_path), compress=False)
+    with zipfile.ZipFile(stored_path) as z:
+        assert all(info.compress_type == zipfile.ZIP_STORED for info in z.infolist()), "Parts were compressed"
+    assert _deck_parts(stored_path) == _deck_parts(built_path), "Uncompressed deck parts differ"
+
+    print("\nPASS: Uncompressed build")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "=" * 60)
+    print("SAMPLE DECK TESTS")
+    print("=" * 60)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = Path(tmp)
+            built_path = tmp_dir / "built.pptx"
+            create_sample_presentation(str(built_path))
+
+            test_matches_checked_in_deck(built_path)
+            test_uncompressed_build(built_path, tmp_dir)
+
+        print("\n" + "=" * 60)
+        print("ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\nTEST FAILED: {e}")
+        return 1
+    except Exception as e:
+        print(f"\nTEST ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -6,6 +6,9 @@ Tests the complete flow from mapping to presentation update with mock data.
 
 import logging
 import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
 from pathlib import Path
 
 # Configure logging
@@ -19,8 +22,10 @@ script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
 from sheets_client import MappingRow, MockSheetsClient
-from format_value import format_value
+from format_value import format_value, format_values_bulk, resolve_formatter
 from powerpoint_bridge import PowerPointBridge
+import update_presentation
+from update_presentation import apply_mappings, fetch_values, process_mapping
 
 
 def create_test_config():
@@ -200,49 +205,6 @@ def create_test_config():
     }
 
 
-def process_mapping(bridge: PowerPointBridge, mapping: MappingRow, value, config: dict,
-                    dry_run: bool = False) -> tuple:
-    """Process a single mapping (copied from update_presentation.py for testing)."""
-    defaults = config.get('defaults', {})
-    empty_value = defaults.get('empty_value', '')
-
-    formatted_text = format_value(
-        raw_value=value,
-        fmt=mapping.format,
-        prefix=mapping.prefix,
-        suffix=mapping.suffix,
-        empty_value=empty_value
-    )
-
-    logger.debug(f"Mapping '{mapping.id}': {value} -> '{formatted_text}'")
-
-    if dry_run:
-        if mapping.target_type == 'shape':
-            logger.info(f"[DRY RUN] Would update shape '{mapping.object_name}' on slide {mapping.slide_index} to: {formatted_text}")
-        else:
-            logger.info(f"[DRY RUN] Would update table '{mapping.object_name}' cell ({mapping.row},{mapping.col}) on slide {mapping.slide_index} to: {formatted_text}")
-        return True, "Dry run - no changes made"
-
-    if mapping.target_type == 'shape':
-        return bridge.update_shape_text(
-            slide_index=mapping.slide_index,
-            shape_name=mapping.object_name,
-            new_text=formatted_text
-        )
-    elif mapping.target_type == 'table_cell':
-        if mapping.row is None or mapping.col is None:
-            return False, f"Table cell mapping '{mapping.id}' is missing row or col index"
-        return bridge.update_table_cell(
-            slide_index=mapping.slide_index,
-            table_name=mapping.object_name,
-            row=mapping.row,
-            col=mapping.col,
-            new_text=formatted_text
-        )
-    else:
-        return False, f"Unknown target type '{mapping.target_type}' for mapping '{mapping.id}'"
-
-
 def test_dry_run():
     """Test the full update flow in dry-run mode."""
     print("\n" + "=" * 60)
@@ -258,35 +220,35 @@ def test_dry_run():
     mappings = sheets_client.read_mapping()
     print(f"Loaded {len(mappings)} mappings")
 
-    ranges = sorted(set(m.sheet_range for m in mappings if m.sheet_range))
+    ranges = list(dict.fromkeys(m.sheet_range for m in mappings if m.sheet_range))
     values_by_range = sheets_client.batch_get_values(ranges)
     print(f"Fetched {len(values_by_range)} values")
 
-    # Open presentation
-    pptx_path = config['powerpoint']['file_path']
-    bridge = PowerPointBridge(pptx_path)
-    assert bridge.open(), f"Failed to open {pptx_path}"
-    print(f"Opened presentation: {pptx_path}")
+    # A dry run never touches the presentation, so it isn't opened
+    bridge = None
 
-    # Process each mapping in dry-run mode
-    success_count = 0
-    error_count = 0
+    empty_value = config.get('defaults', {}).get('empty_value', '')
 
     print("\n--- DRY RUN UPDATES ---")
-    for mapping in mappings:
-        raw_value = values_by_range.get(mapping.sheet_range)
-        success, message = process_mapping(bridge, mapping, raw_value, config, dry_run=True)
-        if success:
-            success_count += 1
-        else:
-            error_count += 1
-            print(f"ERROR: {message}")
-
-    print(f"\nDry run complete: {success_count} successful, {error_count} errors")
-    assert error_count == 0, f"Encountered {error_count} errors during dry run"
+    results = apply_mappings(bridge, mappings, values_by_range, empty_value, dry_run=True)
+    errors = [f"{mapping.id}: {message}" for mapping, success, message in results if not success]
+    for error in errors:
+        print(f"ERROR: {error}")
+
+    print(f"\nDry run complete: {len(results) - len(errors)} successful, {len(errors)} errors")
+    assert len(results) == len(mappings), f"Processed {len(results)} of {len(mappings)} mappings"
+    assert not errors, f"Encountered {len(errors)} errors during dry run"
     print("\nPASS: Full Update Flow (DRY RUN)")
 
 
+def _object_text(bridge: PowerPointBridge, mapping: MappingRow) -> str:
+    """Current text of the shape or table cell a mapping targets."""
+    if mapping.target_type == 'table_cell':
+        table = bridge._find_table_by_name(mapping.slide_index, mapping.object_name)
+        return table.cell(mapping.row - 1, mapping.col - 1).text
+    return bridge._find_shape_by_name(mapping.slide_index, mapping.object_name).text_frame.text
+
+
 def test_actual_update():
     """Test the full update flow with actual changes."""
     print("\n" + "=" * 60)
@@ -300,32 +262,33 @@ def test_actual_update():
 
     # Get mappings and values
     mappings = sheets_client.read_mapping()
-    ranges = sorted(set(m.sheet_range for m in mappings if m.sheet_range))
+    ranges = list(dict.fromkeys(m.sheet_range for m in mappings if m.sheet_range))
     values_by_range = sheets_client.batch_get_values(ranges)
 
-    # Open presentation
+    # Several slides are targeted, as in a real deck
+    slide_indexes = [m.slide_index for m in mappings]
+    assert len(set(slide_indexes)) > 1, "Mappings must span several slides"
+
+    # Open presentation the way update_presentation.py does
     pptx_path = config['powerpoint']['file_path']
-    bridge = PowerPointBridge(pptx_path)
+    bridge = PowerPointBridge(pptx_path, lazy=True)
     assert bridge.open(), f"Failed to open {pptx_path}"
 
-    # Process each mapping with actual updates
-    success_count = 0
-    error_count = 0
-    errors = []
+    empty_value = config.get('defaults', {}).get('empty_value', '')
 
     print("\n--- ACTUAL UPDATES ---")
-    for mapping in mappings:
-        raw_value = values_by_range.get(mapping.sheet_range)
-        success, message = process_mapping(bridge, mapping, raw_value, config, dry_run=False)
+    results = apply_mappings(bridge, mappings, values_by_range, empty_value)
+    errors = []
+    for mapping, success, message in results:
         if success:
-            success_count += 1
             print(f"OK: {mapping.id} -> {message}")
         else:
-            error_count += 1
             errors.append(f"{mapping.id}: {message}")
             print(f"FAIL: {mapping.id} -> {message}")
 
-    print(f"\nUpdate complete: {success_count} successful, {error_count} errors")
+    print(f"\nUpdate complete: {len(results) - len(errors)} successful, {len(errors)} errors")
+    assert len(results) == len(mappings), f"Processed {len(results)} of {len(mappings)} mappings"
+    assert [m.slide_index for m, _, _ in results] == sorted(slide_indexes), "Results not grouped by slide"
 
     # Save to test output
     output_path = script_dir / "test_updated_deck.pptx"
@@ -336,11 +299,20 @@ def test_actual_update():
     assert output_path.exists(), "Output file not created"
     print(f"Output file size: {output_path.stat().st_size} bytes")
 
+    # Every update must have reached the saved deck
+    saved = PowerPointBridge(str(output_path))
+    assert saved.open(), f"Failed to open {output_path}"
+    for mapping in mappings:
+        expected = format_value(values_by_range[mapping.sheet_range], mapping.format,
+                                mapping.prefix, mapping.suffix, empty_value)
+        text = _object_text(saved, mapping)
+        assert text == expected, f"{mapping.id}: expected '{expected}', got '{text}'"
+
     # Clean up
     output_path.unlink()
     print(f"Cleaned up: {output_path}")
 
-    assert error_count == 0, f"Encountered {error_count} errors: {errors}"
+    assert not errors, f"Encountered {len(errors)} errors: {errors}"
     print("\nPASS: Full Update Flow (ACTUAL)")
 
 
@@ -357,6 +329,8 @@ def test_format_value_integration():
         (1850, "integer", "", "", "1,850"),
         (125, "currency0", "", "", "$125"),
         (44287, "date_mdy", "", "", "April 1, 2021"),
+        ("2021-04-01", "date_mdy", "", "", "April 1, 2021"),
+        ("13/1/2021", "date_short", "", "", "1/2021"),
         ("Q1 2025", "text", "", "", "Q1 2025"),
         (7500000, "currency0", "Total Revenue: ", "", "Total Revenue: $7,500,000"),
         (0.325, "percent1", "Growth: ", " YoY", "Growth: 32.5% YoY"),
@@ -367,9 +341,121 @@ def test_format_value_integration():
         print(f"  format_value({raw_value}, '{fmt}', '{prefix}', '{suffix}') = '{result}'")
         assert expected in result, f"Expected '{expected}' in '{result}'"
 
+    # Bulk formatting must match formatting each value individually
+    column = [7500000, "1,850", None, "", "N/A", -125.5, "1,850", "N/A", 0.0, -0.0]
+    for fmt in ("currency0", "integer", "percent1", "text"):
+        bulk = format_values_bulk(column, fmt, "", " USD", "-")
+        single = [format_value(v, fmt, "", " USD", "-") for v in column]
+        print(f"  format_values_bulk(..., '{fmt}') = {bulk}")
+        assert bulk == single, f"Bulk {bulk} != single {single}"
+        resolved = [resolve_formatter(fmt, "", " USD", "-")(v) for v in column]
+        assert resolved == single, f"Resolved {resolved} != single {single}"
+
+    # format_value doesn't go through the resolve_formatter cache, which stays bounded
+    cached = resolve_formatter.cache_info().currsize
+    for i in range(1000):
+        format_value(1850, "integer", f"Row {i}: ")
+    assert resolve_formatter.cache_info().currsize == cached, "format_value filled the formatter cache"
+    assert resolve_formatter.cache_info().maxsize is not None, "Formatter cache is unbounded"
+
     print("\nPASS: Format Value Integration")
 
 
+def test_signed_zero_formatting():
+    """Test that 0.0 and -0.0 are formatted independently rather than sharing a cached result."""
+    print("\n" + "=" * 60)
+    print("TEST: Signed Zero Formatting")
+    print("=" * 60)
+
+    bridge = PowerPointBridge(str(script_dir / 'sample_investor_deck.pptx'))
+    assert bridge.open(), "Failed to open sample deck"
+
+    for fmt in ("percent1", "decimal1"):
+        mapping = MappingRow(id=f"zero_{fmt}", sheet_range="DataVault!Z1", slide_index=2,
+                             target_type="shape", object_name="GrowthValue", format=fmt)
+        for value in (0.0, -0.0):
+            success, message = process_mapping(bridge, mapping, value)
+            assert success, message
+            text = bridge._find_shape_by_name(2, "GrowthValue").text_frame.text
+            expected = format_value(value, fmt)
+            print(f"  {fmt} {value!r} -> '{text}'")
+            assert text == expected, f"Expected '{expected}' for {value!r}, got '{text}'"
+
+    print("\nPASS: Signed Zero Formatting")
+
+
+class CountingSheetsClient(MockSheetsClient):
+    """MockSheetsClient that counts batch_get_values calls."""
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.fetches = 0
+
+    def batch_get_values(self, ranges: list) -> dict:
+        self.fetches += 1
+        return super().batch_get_values(ranges)
+
+
+def test_fetch_values_cache():
+    """Test when fetch_values reuses the cached Sheets response and when it refetches."""
+    print("\n" + "=" * 60)
+    print("TEST: Sheets Values Cache")
+    print("=" * 60)
+
+    config = create_test_config()
+    ranges = ["DataVault!B2", "DataVault!B5"]
+    saved_file, saved_ttl = update_presentation.VALUES_CACHE_FILE, update_presentation.VALUES_CACHE_TTL
+    with tempfile.TemporaryDirectory() as tmp:
+        update_presentation.VALUES_CACHE_FILE = Path(tmp) / "values.pkl"
+        try:
+            client = CountingSheetsClient(config['google'])
+            values, age = fetch_values(client, "SHEET_A", ranges)
+            assert client.fetches == 1 and age is None, "First fetch must call Sheets"
+
+            # Same spreadsheet and ranges within the TTL: served from the cache
+            cached_values, age = fetch_values(client, "SHEET_A", ranges)
+            print(f"  TTL hit -> reused response from {age:.1f}s ago")
+            assert client.fetches == 1 and age is not None, "Cache not reused within TTL"
+            assert cached_values == values, f"Cached {cached_values} != fetched {values}"
+
+            # Different ranges or spreadsheet: refetched
+            fetch_values(client, "SHEET_A", ranges[:1])
+            assert client.fetches == 2, "Different ranges served from cache"
+            fetch_values(client, "SHEET_B", ranges[:1])
+            assert client.fetches == 3, "Different spreadsheet served from cache"
+
+            # --no-cache: refetched even though the cache matches
+            _, age = fetch_values(client, "SHEET_B", ranges[:1], use_cache=False)
+            assert client.fetches == 4 and age is None, "use_cache=False served from cache"
+
+            # Expired: refetched
+            update_presentation.VALUES_CACHE_TTL = 0
+            _, age = fetch_values(client, "SHEET_B", ranges[:1])
+            assert client.fetches == 5 and age is None, "Expired cache reused"
+            update_presentation.VALUES_CACHE_TTL = saved_ttl
+
+            # Mock mode never reads or writes the cache, even without --no-cache
+            update_presentation.VALUES_CACHE_FILE.unlink()
+            saved_load_config, saved_argv = update_presentation.load_config, sys.argv
+            update_presentation.load_config = lambda config_path: config
+            sys.argv = ["update_presentation.py", "--dry-run"]
+            out = StringIO()
+            try:
+                with redirect_stdout(out):
+                    update_presentation.main()
+            except SystemExit as e:
+                assert e.code == 0, f"Mock dry run exited with {e.code}"
+            finally:
+                update_presentation.load_config, sys.argv = saved_load_config, saved_argv
+            assert "Update Complete (DRY RUN)" in out.getvalue(), "Mock dry run did not finish"
+            assert not update_presentation.VALUES_CACHE_FILE.exists(), "Mock mode wrote the values cache"
+            assert "Sheets values: reused" not in out.getvalue(), "Mock run reported a cached response"
+        finally:
+            update_presentation.VALUES_CACHE_FILE, update_presentation.VALUES_CACHE_TTL = saved_file, saved_ttl
+
+    print("\nPASS: Sheets Values Cache")
+
+
 def run_all_tests():
     """Run all integration tests."""
     print("\n" + "=" * 60)
@@ -378,6 +464,8 @@ def run_all_tests():
 
     try:
         test_format_value_integration()
+        test_signed_zero_formatting()
+        test_fetch_values_cache()
         test_dry_run()
         test_actual_update()
 
@@ -212,6 +212,97 @@ def test_save_presentation(bridge: PowerPointBridge):
     print(f"Cleaned up: {output_path}")
 
 
+def test_save_failure():
+    """Test that a failed save is reported rather than raised."""
+    print("\n" + "=" * 60)
+    print("TEST: Save failure")
+    print("=" * 60)
+
+    pptx_path = script_dir / "sample_investor_deck.pptx"
+    bridge = PowerPointBridge(str(pptx_path))
+    assert bridge.open(), "Failed to open presentation"
+
+    success, message = bridge.update_shape_text(2, "GrowthValue", "41.0%")
+    assert success, f"Failed to update GrowthValue: {message}"
+
+    bad_path = script_dir / "missing_dir" / "test_output.pptx"
+    success = bridge.save(str(bad_path))
+    print(f"Save to missing directory: {success}")
+    assert not success, "Save into a missing directory reported success"
+    assert not bad_path.exists(), "Output written despite the failed save"
+
+    print("\nPASS: Save failure")
+
+
+def test_lazy_open():
+    """Test updating a presentation opened in lazy mode."""
+    print("\n" + "=" * 60)
+    print("TEST: Lazy open")
+    print("=" * 60)
+
+    pptx_path = script_dir / "sample_investor_deck.pptx"
+    bridge = PowerPointBridge(str(pptx_path), lazy=True)
+    assert bridge.open(), "Failed to open presentation lazily"
+    assert bridge.get_slide_count() == 5, "Slide count mismatch in lazy mode"
+
+    bridge.index_slides([2, 99])
+    assert set(bridge._shape_index) == {2}, f"Expected only slide 2 indexed, got {set(bridge._shape_index)}"
+
+    success, message = bridge.update_shape_text(2, "RevenueValue", "$9,999")
+    print(f"Update RevenueValue: {success} - {message}")
+    assert success, f"Failed to update RevenueValue: {message}"
+
+    success, message = bridge.update_shape_text(99, "Title", "Test")
+    assert not success, "Expected failure for non-existent slide"
+
+    output_path = script_dir / "test_lazy_output.pptx"
+    assert bridge.save(str(output_path)), "Failed to save lazily opened presentation"
+
+    # Re-open eagerly: the touched slide is updated and untouched slides survive intact
+    bridge2 = PowerPointBridge(str(output_path))
+    assert bridge2.open(), "Failed to re-open saved presentation"
+    revenue = bridge2._find_shape_by_name(2, "RevenueValue").text_frame.text
+    assert revenue == "$9,999", f"Expected '$9,999', got '{revenue}'"
+    assert len(bridge2.list_tables(4)) == 1, "KPITable missing after lazy save"
+
+    output_path.unlink()
+    print("\nPASS: Lazy open")
+
+
+def test_unchanged_updates():
+    """Test that writing a shape's or cell's current text leaves the slide untouched."""
+    print("\n" + "=" * 60)
+    print("TEST: Unchanged updates")
+    print("=" * 60)
+
+    pptx_path = script_dir / "sample_investor_deck.pptx"
+    bridge = PowerPointBridge(str(pptx_path))
+    assert bridge.open(), "Failed to open presentation"
+
+    growth = bridge._find_shape_by_name(2, "GrowthValue").text_frame.text
+    success, message = bridge.update_shape_text(2, "GrowthValue", growth)
+    print(f"Update GrowthValue: {success} - {message}")
+    assert success, f"Failed to re-apply GrowthValue: {message}"
+
+    cell_text = bridge._find_table_by_name(4, "KPITable").cell(1, 1).text
+    success, message = bridge.update_table_cell(4, "KPITable", 2, 2, cell_text)
+    print(f"Update KPITable (2,2): {success} - {message}")
+    assert success, f"Failed to re-apply KPITable cell: {message}"
+    assert not bridge._dirty_slides, f"Unchanged updates dirtied slides {bridge._dirty_slides}"
+
+    # With nothing dirty, saving elsewhere copies the original file byte for byte
+    output_path = script_dir / "test_unchanged_output.pptx"
+    assert bridge.save(str(output_path)), "Failed to save unchanged presentation"
+    assert output_path.read_bytes() == pptx_path.read_bytes(), "Unchanged save rewrote the deck"
+    output_path.unlink()
+
+    success, message = bridge.update_shape_text(2, "GrowthValue", growth + "!")
+    assert success, f"Failed to update GrowthValue: {message}"
+    assert bridge._dirty_slides == {2}, f"Expected slide 2 dirty, got {bridge._dirty_slides}"
+
+    print("\nPASS: Unchanged updates")
+
+
 def run_all_tests():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -225,6 +316,9 @@ def run_all_tests():
         test_update_shape_text(bridge)
         test_update_table_cell(bridge)
         test_save_presentation(bridge)
+        test_save_failure()
+        test_lazy_open()
+        test_unchanged_updates()
 
         print("\n" + "=" * 60)
         print("ALL TESTS PASSED!")
@@ -10,26 +10,39 @@ Usage:
 import argparse
 import logging
 import os
+import pickle
 import sys
+import time
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import yaml
-
-from sheets_client import SheetsClient, MappingRow, create_client
-from format_value import format_value
+from format_value import resolve_formatter, set_debug_enabled
 from powerpoint_bridge import PowerPointBridge, check_presentation
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+# yaml and sheets_client (which pulls in the Google API stack) are imported where
+# they are used, so --help and the --list-* utilities start quickly
+if TYPE_CHECKING:
+    from sheets_client import MappingRow
+
 logger = logging.getLogger(__name__)
 
 SCRIPT_DIR = Path(__file__).parent
 
+# Last batchGet response, reused by re-runs within VALUES_CACHE_TTL seconds
+VALUES_CACHE_FILE = SCRIPT_DIR / '.sheets_values_cache.pkl'
+VALUES_CACHE_TTL = 300
+
+
+def _configure_logging(verbose: bool = False):
+    """Configure root logging once the command line has been parsed."""
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
 
 def load_config(config_path: str) -> dict:
     """Load configuration from YAML file."""
@@ -37,56 +50,151 @@ def load_config(config_path: str) -> dict:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file '{config_path}' not found.")
 
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # libyaml when available
     with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=loader)
 
     logger.debug(f"Loaded configuration from {config_path}")
     return config
 
 
-def process_mapping(bridge: PowerPointBridge, mapping: MappingRow, value, config: dict,
+# Only str values (what Sheets returns) are memoized: equal numeric keys such as
+# 1/1.0/True or 0.0/-0.0 would share a cache entry but format differently
+@lru_cache(maxsize=4096)
+def _cached_format(raw_value: str, fmt: str, prefix: str, suffix: str, empty_value: str) -> str:
+    """format_value memoized across mappings that share a string value and format."""
+    return resolve_formatter(fmt, prefix, suffix, empty_value)(raw_value)
+
+
+# Mapping target_type -> bridge call applying the formatted text
+_TARGET_UPDATERS = {
+    'shape': lambda bridge, mapping, text: bridge.update_shape_text(
+        slide_index=mapping.slide_index,
+        shape_name=mapping.object_name,
+        new_text=text
+    ),
+    'table_cell': lambda bridge, mapping, text: bridge.update_table_cell(
+        slide_index=mapping.slide_index,
+        table_name=mapping.object_name,
+        row=mapping.row,
+        col=mapping.col,
+        new_text=text
+    ),
+}
+
+
+def process_mapping(bridge: Optional[PowerPointBridge], mapping: 'MappingRow', value, empty_value: str = '',
                     dry_run: bool = False) -> tuple[bool, str]:
     """
     Process a single mapping: format the value and update PowerPoint.
+
+    bridge may be None for a dry run, which only formats and logs.
     """
-    defaults = config.get('defaults', {})
-    empty_value = defaults.get('empty_value', '')
-
-    formatted_text = format_value(
-        raw_value=value,
-        fmt=mapping.format,
-        prefix=mapping.prefix,
-        suffix=mapping.suffix,
-        empty_value=empty_value
-    )
+    if mapping.format == 'text' and type(value) is str and not mapping.prefix and not mapping.suffix:
+        # Plain text passes through as-is; only blank cells need the empty value
+        formatted_text = value if value.strip() else empty_value
+    else:
+        if type(value) is str:
+            formatted_text = _cached_format(value, mapping.format, mapping.prefix, mapping.suffix, empty_value)
+        else:
+            formatted_text = resolve_formatter(mapping.format, mapping.prefix, mapping.suffix, empty_value)(value)
 
-    logger.debug(f"Mapping '{mapping.id}': {value} -> '{formatted_text}'")
+    logger.debug("Mapping '%s': %s -> '%s'", mapping.id, value, formatted_text)
 
     if dry_run:
         if mapping.target_type == 'shape':
-            logger.info(f"[DRY RUN] Would update shape '{mapping.object_name}' on slide {mapping.slide_index} to: {formatted_text}")
+            logger.info("[DRY RUN] Would update shape '%s' on slide %s to: %s",
+                        mapping.object_name, mapping.slide_index, formatted_text)
         else:
-            logger.info(f"[DRY RUN] Would update table '{mapping.object_name}' cell ({mapping.row},{mapping.col}) on slide {mapping.slide_index} to: {formatted_text}")
+            logger.info("[DRY RUN] Would update table '%s' cell (%s,%s) on slide %s to: %s",
+                        mapping.object_name, mapping.row, mapping.col, mapping.slide_index, formatted_text)
         return True, "Dry run - no changes made"
 
-    if mapping.target_type == 'shape':
-        return bridge.update_shape_text(
-            slide_index=mapping.slide_index,
-            shape_name=mapping.object_name,
-            new_text=formatted_text
-        )
-    elif mapping.target_type == 'table_cell':
-        if mapping.row is None or mapping.col is None:
-            return False, f"Table cell mapping '{mapping.id}' is missing row or col index"
-        return bridge.update_table_cell(
-            slide_index=mapping.slide_index,
-            table_name=mapping.object_name,
-            row=mapping.row,
-            col=mapping.col,
-            new_text=formatted_text
-        )
-    else:
+    updater = _TARGET_UPDATERS.get(mapping.target_type)
+    if updater is None:
         return False, f"Unknown target type '{mapping.target_type}' for mapping '{mapping.id}'"
+    if mapping.target_type == 'table_cell' and (mapping.row is None or mapping.col is None):
+        return False, f"Table cell mapping '{mapping.id}' is missing row or col index"
+    return updater(bridge, mapping, formatted_text)
+
+
+def fetch_values(sheets_client, spreadsheet_id: str, ranges: list[str],
+                 use_cache: bool = True) -> tuple[dict, Optional[float]]:
+    """
+    Fetch values with sheets_client.batch_get_values, reusing a recent response.
+
+    The last response is kept in VALUES_CACHE_FILE and served again if the same
+    spreadsheet and ranges are requested within VALUES_CACHE_TTL seconds.
+
+    Returns:
+        (values_by_range, age in seconds of the reused response, or None if fetched)
+    """
+    key = (spreadsheet_id, tuple(ranges))
+    if use_cache:
+        try:
+            with open(VALUES_CACHE_FILE, 'rb') as f:
+                cached = pickle.load(f)
+            age = time.time() - cached['fetched_at']
+            if cached['key'] == key and 0 <= age < VALUES_CACHE_TTL:
+                logger.info(f"Using Sheets values cached {age:.0f}s ago (use --no-cache to refetch)")
+                return cached['values'], age
+        except Exception:
+            # No usable cache; fetch below
+            pass
+
+    values = sheets_client.batch_get_values(ranges)
+
+    if use_cache:
+        try:
+            with open(VALUES_CACHE_FILE, 'wb') as f:
+                pickle.dump({'key': key, 'fetched_at': time.time(), 'values': values}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug(f"Could not write values cache {VALUES_CACHE_FILE}: {e}")
+    return values, None
+
+
+def apply_slide_mappings(bridge: Optional[PowerPointBridge], slide_mappings: list, values_by_range: dict,
+                         empty_value: str = '', dry_run: bool = False) -> list:
+    """
+    Process one slide's mappings in order.
+
+    Returns:
+        (mapping, success, message) for each mapping, in the order given.
+    """
+    results = []
+    for mapping in slide_mappings:
+        raw_value = values_by_range.get(mapping.sheet_range)
+        success, message = process_mapping(bridge, mapping, raw_value, empty_value, dry_run)
+        results.append((mapping, success, message))
+    return results
+
+
+def apply_mappings(bridge: Optional[PowerPointBridge], mappings: list, values_by_range: dict,
+                   empty_value: str = '', dry_run: bool = False) -> list:
+    """
+    Process all mappings slide by slide.
+
+    bridge may be None for a dry run.
+
+    Returns:
+        (mapping, success, message) for each mapping, grouped by slide.
+    """
+    # Work slide by slide, and object by object within a slide (sort is stable,
+    # so mappings that target the same object keep their sheet order)
+    mappings_by_slide = defaultdict(list)
+    for mapping in sorted(mappings, key=lambda m: (m.slide_index, m.target_type, m.object_name)):
+        mappings_by_slide[mapping.slide_index].append(mapping)
+
+    # In lazy mode, parse only the slides the mappings target
+    if bridge is not None:
+        bridge.index_slides(mappings_by_slide)
+
+    results = []
+    for slide_mappings in mappings_by_slide.values():
+        results.extend(apply_slide_mappings(bridge, slide_mappings, values_by_range, empty_value, dry_run))
+    return results
 
 
 def main():
@@ -129,11 +237,17 @@ def main():
         metavar='SLIDE',
         help='List tables on specified slide (for setup)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Always fetch fresh values instead of reusing ones fetched in the last {VALUES_CACHE_TTL}s'
+    )
 
     args = parser.parse_args()
 
+    _configure_logging(args.verbose)
     if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+        set_debug_enabled()
 
     os.chdir(SCRIPT_DIR)
 
@@ -182,15 +296,19 @@ def main():
     if dry_run:
         logger.info("Running in DRY RUN mode - no changes will be made")
 
-    # Open presentation
-    bridge = PowerPointBridge(pptx_path)
-    if not bridge.open():
-        logger.error(f"Failed to open PowerPoint: {pptx_path}")
-        sys.exit(1)
+    # Open presentation (a dry run never touches it, so skip parsing the deck).
+    # Lazy: only the slides that mappings target get parsed, indexed below
+    bridge = None
+    if not dry_run:
+        bridge = PowerPointBridge(pptx_path, lazy=True)
+        if not bridge.open():
+            logger.error(f"Failed to open PowerPoint: {pptx_path}")
+            sys.exit(1)
 
-    logger.info(f"Opened presentation: {pptx_path} ({bridge.get_slide_count()} slides)")
+        logger.info(f"Opened presentation: {pptx_path} ({bridge.get_slide_count()} slides)")
 
     # Initialize Sheets client
+    from sheets_client import create_client
     try:
         sheets_client = create_client(config)
         logger.info("Initialized Google Sheets client")
@@ -210,14 +328,17 @@ def main():
         sys.exit(1)
 
     # Collect unique ranges to fetch
-    ranges = sorted(set(m.sheet_range for m in mappings if m.sheet_range))
+    ranges = list(dict.fromkeys(m.sheet_range for m in mappings if m.sheet_range))
     if not ranges:
         logger.warning("No valid sheet ranges found in mappings")
         sys.exit(0)
 
     # Batch fetch all values from Google Sheets
     try:
-        values_by_range = sheets_client.batch_get_values(ranges)
+        # Mock clients are already in memory; only cache real Sheets responses
+        use_cache = not args.no_cache and not config.get('mock_mode', False)
+        spreadsheet_id = config.get('google', {}).get('spreadsheet_id', '')
+        values_by_range, cache_age = fetch_values(sheets_client, spreadsheet_id, ranges, use_cache)
         logger.info(f"Fetched {len(values_by_range)} values from Google Sheets")
     except Exception as e:
         logger.error(f"Failed to fetch values from Sheets: {e}")
@@ -228,13 +349,13 @@ def main():
     error_count = 0
     errors = []
 
-    for mapping in mappings:
-        raw_value = values_by_range.get(mapping.sheet_range)
-        success, message = process_mapping(bridge, mapping, raw_value, config, dry_run)
+    empty_value = config.get('defaults', {}).get('empty_value', '')
+    results = apply_mappings(bridge, mappings, values_by_range, empty_value, dry_run)
 
+    for mapping, success, message in results:
         if success:
             success_count += 1
-            logger.info(f"Updated '{mapping.id}': {message}")
+            logger.info("Updated '%s': %s", mapping.id, message)
         else:
             error_count += 1
             error_msg = f"Failed to update '{mapping.id}': {message}"
@@ -256,6 +377,8 @@ def main():
     print(f"Update Complete{' (DRY RUN)' if dry_run else ''}")
     print(f"  Successful: {success_count}")
     print(f"  Failed: {error_count}")
+    if cache_age is not None:
+        print(f"  Sheets values: reused from {cache_age:.0f}s ago (use --no-cache to refetch)")
     print("=" * 50)
 
     if errors: